@@ -1,8 +1,8 @@
 """
 Service for calculating delivery costs
 """
-from typing import List
-from models import Package
+from typing import List, Optional, Tuple
+from models import Package, PricingScenario, ScenarioResult
 from offer_service import OfferService
 
 
@@ -20,20 +20,101 @@ class CostCalculator:
 
     def calculate_cost(self, package: Package) -> None:
         """Calculate cost and discount for a single package"""
-        delivery_cost = (self.base_delivery_cost + 
-                        package.weight * self.WEIGHT_COST_MULTIPLIER + 
-                        package.distance * self.DISTANCE_COST_MULTIPLIER)
+        percentage = self._discount_percentage(
+            package.weight, package.distance, package.offer_code, self.offer_service
+        )
+        package.discount, package.total_cost = self._price(
+            package.weight, package.distance, percentage,
+            self.base_delivery_cost, self.WEIGHT_COST_MULTIPLIER,
+            self.DISTANCE_COST_MULTIPLIER
+        )
+
+    @staticmethod
+    def _discount_percentage(weight: float, distance: float,
+                             offer_code: Optional[str],
+                             offer_service: OfferService) -> float:
+        """Return the applicable offer discount percentage, or 0"""
+        if offer_code:
+            offer = offer_service.get_offer(offer_code)
+            if offer and offer.is_applicable(weight, distance):
+                return offer.discount_percentage
+        return 0
+
+    @staticmethod
+    def _price(weight: float, distance: float, discount_percentage: float,
+               base_delivery_cost: float, weight_multiplier: float,
+               distance_multiplier: float) -> Tuple[int, int]:
+        """Return the rounded (discount, total_cost) for one package"""
+        delivery_cost = (base_delivery_cost + 
+                        weight * weight_multiplier + 
+                        distance * distance_multiplier)
 
         discount = 0
-        if package.offer_code:
-            offer = self.offer_service.get_offer(package.offer_code)
-            if offer and offer.is_applicable(package.weight, package.distance):
-                discount = delivery_cost * (offer.discount_percentage / 100)
+        if discount_percentage:
+            discount = delivery_cost * (discount_percentage / 100)
 
-        package.discount = round(discount)
-        package.total_cost = round(delivery_cost - discount)
+        return round(discount), round(delivery_cost - discount)
 
     def calculate_costs_batch(self, packages: List[Package]) -> None:
         """Calculate costs for multiple packages"""
         for package in packages:
             self.calculate_cost(package)
+
+    def calculate_scenarios(self, packages: List[Package],
+                            scenarios: List[PricingScenario],
+                            include_details: bool = False) -> List[ScenarioResult]:
+        """
+        Price the manifest under several scenarios in a single pass.
+        Offer discounts are looked up once per package and offer set, then
+        each scenario's base cost and multipliers are applied. Packages are
+        left untouched; scenarios without their own offer service fall back
+        to this calculator's offers.
+        """
+        if not scenarios:
+            raise ValueError("At least one pricing scenario is required")
+
+        results = [ScenarioResult(scenario.name) for scenario in scenarios]
+        if include_details:
+            for result in results:
+                result.package_costs = []
+
+        # Offer sets shared between scenarios are only evaluated once
+        offer_services = []
+        configs = []
+        for scenario, result in zip(scenarios, results):
+            offers = scenario.offer_service or self.offer_service
+            if not any(offers is known for known in offer_services):
+                offer_services.append(offers)
+            service_index = next(i for i, known in enumerate(offer_services)
+                                 if known is offers)
+            configs.append((
+                scenario.base_delivery_cost,
+                self.WEIGHT_COST_MULTIPLIER if scenario.weight_multiplier is None
+                else scenario.weight_multiplier,
+                self.DISTANCE_COST_MULTIPLIER if scenario.distance_multiplier is None
+                else scenario.distance_multiplier,
+                service_index,
+                result,
+            ))
+
+        for package in packages:
+            weight = package.weight
+            distance = package.distance
+            percentages = [
+                self._discount_percentage(weight, distance, package.offer_code, offers)
+                for offers in offer_services
+            ]
+
+            for base_cost, weight_multiplier, distance_multiplier, service_index, result in configs:
+                discount, total_cost = self._price(
+                    weight, distance, percentages[service_index],
+                    base_cost, weight_multiplier, distance_multiplier
+                )
+                result.total_discount += discount
+                result.total_revenue += total_cost
+                if include_details:
+                    result.package_costs.append(
+                        (package.pkg_id, discount, total_cost)
+                    )
+
+        return results
@@ -2,34 +2,62 @@
 Service for scheduling package deliveries
 """
 import heapq
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from models import Package, Vehicle
+from scheduler_checkpoint import SchedulerCheckpoint
 
 
 class DeliveryScheduler:
     """Schedules package deliveries across available vehicles"""
 
+    DEFAULT_CHECKPOINT_INTERVAL = 1000
+
     def __init__(self, vehicles: List[Vehicle]):
         if not vehicles:
             raise ValueError("At least one vehicle is required")
         self.vehicles = vehicles
 
-    def schedule_deliveries(self, packages: List[Package]) -> None:
-        """Assign delivery times to all packages"""
+    def schedule_deliveries(self, packages: List[Package],
+                            checkpoint_path: Optional[str] = None,
+                            checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+                            resume: bool = False) -> None:
+        """
+        Assign delivery times to all packages.
+        With checkpoint_path set, scheduler state is saved every
+        checkpoint_interval trips; resume continues from a saved checkpoint.
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive")
         if not packages:
             return
 
-        packages_to_deliver = list(packages)
-        # Priority queue: (available_time, vehicle_index, vehicle)
-        vehicle_queue = [(0.0, idx, vehicle) 
-                        for idx, vehicle in enumerate(self.vehicles)]
-        heapq.heapify(vehicle_queue)
+        fingerprint = None
+        if checkpoint_path:
+            fingerprint = SchedulerCheckpoint.compute_fingerprint(packages, self.vehicles)
+
+        checkpoint = None
+        if checkpoint_path and resume:
+            checkpoint = SchedulerCheckpoint.load(checkpoint_path)
 
+        if checkpoint:
+            if checkpoint.fingerprint != fingerprint:
+                raise ValueError("Checkpoint does not match the packages and vehicles")
+            packages_to_deliver, vehicle_queue = self._restore_state(
+                packages, checkpoint
+            )
+        else:
+            packages_to_deliver = list(packages)
+            # Priority queue: (available_time, vehicle_index, vehicle)
+            vehicle_queue = [(0.0, idx, vehicle) 
+                            for idx, vehicle in enumerate(self.vehicles)]
+            heapq.heapify(vehicle_queue)
+
+        trips = 0
         while packages_to_deliver:
             available_time, _, vehicle = heapq.heappop(vehicle_queue)
 
             # Select packages for this trip
-            shipment, packages_to_deliver = self._select_shipment(
+            shipment, packages_to_deliver = self.select_shipment(
                 packages_to_deliver, vehicle.max_load
             )
 
@@ -38,20 +66,71 @@ class DeliveryScheduler:
                 heapq.heappush(vehicle_queue, (available_time + 0.1, _, vehicle))
                 continue
 
-            # Assign delivery times
-            for package in shipment:
-                package.delivery_time = round(
-                    available_time + (package.distance / vehicle.max_speed), 2
-                )
+            return_time = self.dispatch_trip(available_time, vehicle, shipment)
+            heapq.heappush(vehicle_queue, (return_time, _, vehicle))
 
-            # Calculate when vehicle returns
-            max_trip_time = max(pkg.distance / vehicle.max_speed 
-                              for pkg in shipment)
-            return_time = available_time + (max_trip_time * 2)
+            trips += 1
+            if checkpoint_path and trips % checkpoint_interval == 0:
+                self._save_state(checkpoint_path, fingerprint, packages,
+                                 packages_to_deliver, vehicle_queue)
 
-            heapq.heappush(vehicle_queue, (return_time, _, vehicle))
+        if checkpoint_path:
+            SchedulerCheckpoint.remove(checkpoint_path)
+
+    @staticmethod
+    def dispatch_trip(available_time: float, vehicle: Vehicle,
+                      shipment: List[Package]) -> float:
+        """Assign delivery times for one trip and return when the vehicle is back"""
+        for package in shipment:
+            package.delivery_time = round(
+                available_time + (package.distance / vehicle.max_speed), 2
+            )
+
+        max_trip_time = max(pkg.distance / vehicle.max_speed 
+                          for pkg in shipment)
+        return available_time + (max_trip_time * 2)
+
+    def _save_state(self, path: str, fingerprint: str, packages: List[Package],
+                    pending: List[Package], vehicle_queue: list) -> None:
+        """Write the current scheduling state to a checkpoint file"""
+        # Packages are recorded by manifest position, since IDs may repeat
+        position = {id(pkg): idx for idx, pkg in enumerate(packages)}
+        pending_indices = [position[id(pkg)] for pkg in pending]
+        pending_set = set(pending_indices)
+        delivery_times = [(idx, pkg.delivery_time) for idx, pkg in enumerate(packages)
+                          if idx not in pending_set and pkg.delivery_time is not None]
+        SchedulerCheckpoint(
+            fingerprint,
+            [(time, idx) for time, idx, _ in vehicle_queue],
+            delivery_times,
+            pending_indices,
+        ).save(path)
+
+    def _restore_state(self, packages: List[Package],
+                       checkpoint: SchedulerCheckpoint) -> Tuple[List[Package], list]:
+        """Rebuild pending packages and the vehicle queue from a checkpoint"""
+        if len(checkpoint.vehicle_queue) != len(self.vehicles):
+            raise ValueError("Checkpoint does not match the vehicle fleet")
+
+        indices = [idx for idx, _ in checkpoint.delivery_times] + checkpoint.pending_indices
+        if any(not 0 <= idx < len(packages) for idx in indices):
+            raise ValueError("Checkpoint does not match the package manifest")
+
+        for idx, delivery_time in checkpoint.delivery_times:
+            packages[idx].delivery_time = delivery_time
+        pending = [packages[idx] for idx in checkpoint.pending_indices]
+
+        vehicle_queue = []
+        for time, idx in checkpoint.vehicle_queue:
+            if not 0 <= idx < len(self.vehicles):
+                raise ValueError("Checkpoint does not match the vehicle fleet")
+            vehicle_queue.append((time, idx, self.vehicles[idx]))
+        heapq.heapify(vehicle_queue)
+
+        return pending, vehicle_queue
 
-    def _select_shipment(self, packages: List[Package], 
+    @staticmethod
+    def select_shipment(packages: List[Package], 
                         max_load: float) -> Tuple[List[Package], List[Package]]:
         """
         Select packages for a single shipment.
@@ -1,6 +1,6 @@
 
 from typing import List, Tuple, Optional
-from models import Package
+from models import Package, PricingScenario
 
 class InputParser:
   """Parses and validates input data"""
@@ -65,6 +65,23 @@ class InputParser:
       except (ValueError, IndexError) as e:
           raise ValueError(f"Invalid vehicle info format: {e}")
 
+  @staticmethod
+  def parse_scenario(line: str) -> PricingScenario:
+      """Parse a pricing scenario line: name base_cost [weight_x distance_x]"""
+      try:
+          parts = line.strip().split()
+          if len(parts) not in (2, 4):
+              raise ValueError("Scenario must contain 2 or 4 values")
+
+          name = parts[0]
+          base_cost = float(parts[1])
+          weight_multiplier = float(parts[2]) if len(parts) == 4 else None
+          distance_multiplier = float(parts[3]) if len(parts) == 4 else None
+
+          return PricingScenario(name, base_cost, weight_multiplier, distance_multiplier)
+      except (ValueError, IndexError) as e:
+          raise ValueError(f"Invalid scenario format: {e}")
+
   @staticmethod
   def read_input(lines: List[str]) -> Tuple[float, List[Package], Optional[Tuple[int, float, float]]]:
       """Read and parse all input data"""
@@ -1,4 +1,5 @@
 import sys
+import argparse
 from typing import List
 from input_parser import InputParser
 from offer_service import OfferService
@@ -24,14 +25,48 @@ def print_results(packages: List, include_delivery_time: bool = False):
             print(f"{pkg.pkg_id} {pkg.discount} {pkg.total_cost} {pkg.delivery_time}")
         else:
             print(f"{pkg.pkg_id} {pkg.discount} {pkg.total_cost}") 
+
+
+def print_scenario_results(results: List, include_details: bool = False):
+    """Print per-scenario revenue and discount totals"""
+    for result in results:
+        print(f"{result.name} {result.total_revenue} {result.total_discount}")
+        if include_details:
+            for pkg_id, discount, total_cost in result.package_costs:
+                print(f"  {pkg_id} {discount} {total_cost}")
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Courier delivery cost and time estimation")
+    parser.add_argument("input_file", nargs="?", help="path to the input file")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="periodically save scheduling progress to PATH")
+    parser.add_argument("--checkpoint-interval", type=int,
+                        default=DeliveryScheduler.DEFAULT_CHECKPOINT_INTERVAL,
+                        help="number of vehicle trips between checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="resume scheduling from the checkpoint if one exists")
+    parser.add_argument("--scenarios", metavar="PATH",
+                        help="price the manifest under each scenario listed in PATH")
+    parser.add_argument("--scenario-details", action="store_true",
+                        help="also print per-package costs for each scenario")
+    args = parser.parse_args(argv)
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.scenario_details and not args.scenarios:
+        parser.error("--scenario-details requires --scenarios")
+    return args
+
+
 def main():
   """ Main application logic"""
   
+  args = parse_arguments(sys.argv[1:])
 
   try:
-    if len(sys.argv) > 1:
-      filename = sys.argv[1]
-      lines = read_input_from_file(filename)
+    if args.input_file:
+      lines = read_input_from_file(args.input_file)
     else:
       raise FileNotFoundError(f"Input file not specified")
     
@@ -42,6 +77,17 @@ def main():
     # Initialize services
     offer_service = OfferService()
     cost_calculator = CostCalculator(base_cost, offer_service)
+
+    # Pricing sweep replaces the regular output
+    if args.scenarios:
+        scenarios = [InputParser.parse_scenario(line)
+                     for line in read_input_from_file(args.scenarios)]
+        results = cost_calculator.calculate_scenarios(
+            packages, scenarios, include_details=args.scenario_details
+        )
+        print_scenario_results(results, args.scenario_details)
+        return
+
      # Calculate costs
     cost_calculator.calculate_costs_batch(packages)
     
@@ -52,7 +98,10 @@ def main():
         vehicles = [Vehicle(i + 1, max_speed, max_load) 
                     for i in range(num_vehicles)]
         scheduler = DeliveryScheduler(vehicles)
-        scheduler.schedule_deliveries(packages)
+        scheduler.schedule_deliveries(packages,
+                                      checkpoint_path=args.checkpoint,
+                                      checkpoint_interval=args.checkpoint_interval,
+                                      resume=args.resume)
         include_delivery_time = True
     
     # Print results
@@ -68,4 +68,43 @@ class Vehicle:
         self.available_at = 0.0
 
     def __repr__(self):
-        return f"Vehicle(id={self.vehicle_id}, speed={self.max_speed}, load={self.max_load})"
\ No newline at end of file
+        return f"Vehicle(id={self.vehicle_id}, speed={self.max_speed}, load={self.max_load})"
+
+
+class PricingScenario:
+    """Represents one candidate pricing configuration"""
+
+    def __init__(self, name: str, base_delivery_cost: float,
+                 weight_multiplier: float = None, distance_multiplier: float = None,
+                 offer_service=None):
+        if not name or not isinstance(name, str):
+            raise ValueError("Scenario name must be a non-empty string")
+        if base_delivery_cost < 0:
+            raise ValueError("Base delivery cost cannot be negative")
+        if ((weight_multiplier is not None and weight_multiplier < 0) or
+                (distance_multiplier is not None and distance_multiplier < 0)):
+            raise ValueError("Cost multipliers cannot be negative")
+
+        self.name = name
+        self.base_delivery_cost = base_delivery_cost
+        self.weight_multiplier = weight_multiplier
+        self.distance_multiplier = distance_multiplier
+        self.offer_service = offer_service
+
+    def __repr__(self):
+        return (f"PricingScenario(name={self.name}, base={self.base_delivery_cost}, "
+                f"weight_x={self.weight_multiplier}, distance_x={self.distance_multiplier})")
+
+
+class ScenarioResult:
+    """Represents the priced outcome of a manifest under one scenario"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total_revenue = 0
+        self.total_discount = 0
+        self.package_costs = None
+
+    def __repr__(self):
+        return (f"ScenarioResult(name={self.name}, revenue={self.total_revenue}, "
+                f"discount={self.total_discount})")
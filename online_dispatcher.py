@@ -0,0 +1,84 @@
+"""
+Service for dispatching packages that arrive at the depot over time
+"""
+import heapq
+from typing import Iterable, Iterator, List, Optional, Tuple
+from models import Package, Vehicle
+from delivery_scheduler import DeliveryScheduler
+
+
+class OnlineDispatcher:
+    """
+    Dispatches an arrival-ordered stream of packages.
+    At most window_size packages are held at once; each vehicle is filled
+    from that window as soon as it becomes available.
+    """
+
+    def __init__(self, vehicles: List[Vehicle], window_size: int):
+        if not vehicles:
+            raise ValueError("At least one vehicle is required")
+        if window_size <= 0:
+            raise ValueError("Window size must be positive")
+        self.vehicles = vehicles
+        self.window_size = window_size
+        self._max_package_weight = min(vehicle.max_load for vehicle in vehicles)
+
+    def dispatch(self, events: Iterable[Tuple[float, Package]]) -> Iterator[Package]:
+        """
+        Consume (arrival_time, package) events in arrival order and yield
+        each package once its delivery time is assigned.
+        """
+        stream = iter(events)
+        next_event = self._next_event(stream, 0.0)
+        # (arrival_time, package) pairs; packages are tracked by identity
+        # because IDs may repeat
+        window: List[Tuple[float, Package]] = []
+
+        # Priority queue: (available_time, vehicle_index, vehicle)
+        vehicle_queue = [(0.0, idx, vehicle)
+                         for idx, vehicle in enumerate(self.vehicles)]
+        heapq.heapify(vehicle_queue)
+
+        while window or next_event:
+            available_time, idx, vehicle = heapq.heappop(vehicle_queue)
+
+            # Idle vehicle waits for the next arrival
+            if not window:
+                available_time = max(available_time, next_event[0])
+
+            # Admit everything that has arrived, up to the window size
+            while (next_event and len(window) < self.window_size
+                   and next_event[0] <= available_time):
+                window.append(next_event)
+                next_event = self._next_event(stream, next_event[0])
+
+            # Vehicles free before any held package arrived wait for the earliest
+            available_time = max(available_time,
+                                 min(arrival_time for arrival_time, _ in window))
+            ready = [pkg for arrival_time, pkg in window
+                     if arrival_time <= available_time]
+
+            shipment, _ = DeliveryScheduler.select_shipment(ready, vehicle.max_load)
+            shipped = {id(pkg) for pkg in shipment}
+            window = [entry for entry in window if id(entry[1]) not in shipped]
+
+            return_time = DeliveryScheduler.dispatch_trip(available_time, vehicle, shipment)
+            heapq.heappush(vehicle_queue, (return_time, idx, vehicle))
+
+            yield from shipment
+
+    def _next_event(self, stream: Iterator[Tuple[float, Package]],
+                    last_arrival: float) -> Optional[Tuple[float, Package]]:
+        """Read and validate the next arrival event, or None at end of stream"""
+        event = next(stream, None)
+        if event is None:
+            return None
+
+        arrival_time, package = event
+        if arrival_time < last_arrival:
+            raise ValueError("Package events must be ordered by arrival time")
+        if package.weight > self._max_package_weight:
+            raise ValueError(
+                f"Package {package.pkg_id} exceeds vehicle max load"
+            )
+        return event
@@ -0,0 +1,76 @@
+"""
+Persistence of in-progress delivery scheduling state
+"""
+import hashlib
+import json
+import os
+from typing import List, Optional, Tuple
+from models import Package, Vehicle
+
+
+class SchedulerCheckpoint:
+    """Snapshot of scheduler state that can be written to and read from disk"""
+
+    VERSION = 2
+
+    def __init__(self, fingerprint: str, vehicle_queue: List[Tuple[float, int]],
+                 delivery_times: List[Tuple[int, float]], pending_indices: List[int]):
+        self.fingerprint = fingerprint
+        self.vehicle_queue = vehicle_queue
+        self.delivery_times = delivery_times
+        self.pending_indices = pending_indices
+
+    def save(self, path: str) -> None:
+        """Atomically write the checkpoint to path"""
+        data = {
+            'version': self.VERSION,
+            'fingerprint': self.fingerprint,
+            'vehicles': self.vehicle_queue,
+            'delivered': self.delivery_times,
+            'pending': self.pending_indices,
+        }
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def load(path: str) -> Optional['SchedulerCheckpoint']:
+        """Read a checkpoint from path, or return None if none exists"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            if data.get('version') != SchedulerCheckpoint.VERSION:
+                raise ValueError("unsupported checkpoint version")
+            if not isinstance(data['delivered'], list):
+                raise ValueError("delivered times must be a list")
+            if not isinstance(data['pending'], list):
+                raise ValueError("pending packages must be a list")
+            vehicle_queue = [(float(time), int(idx)) for time, idx in data['vehicles']]
+            delivery_times = [(int(idx), float(time)) for idx, time in data['delivered']]
+            pending_indices = [int(idx) for idx in data['pending']]
+            return SchedulerCheckpoint(data['fingerprint'], vehicle_queue,
+                                       delivery_times, pending_indices)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid checkpoint file: {e}")
+
+    @staticmethod
+    def compute_fingerprint(packages: List[Package], vehicles: List[Vehicle]) -> str:
+        """Hash the scheduling input so a checkpoint can be matched to it"""
+        digest = hashlib.sha256()
+        for pkg in packages:
+            digest.update(repr((pkg.pkg_id, pkg.weight, pkg.distance)).encode())
+        digest.update(b'|')
+        for vehicle in vehicles:
+            digest.update(repr((vehicle.max_speed, vehicle.max_load)).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """Delete a checkpoint once it is no longer needed"""
+        if os.path.exists(path):
+            os.remove(path)
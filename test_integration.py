@@ -2,7 +2,7 @@
 Integration tests for courier service
 """
 import unittest
-from models import Package, Vehicle
+from models import Package, PricingScenario, Vehicle
 from offer_service import OfferService
 from cost_calculator import CostCalculator
 from delivery_scheduler import DeliveryScheduler
@@ -72,6 +72,30 @@ class TestEndToEndIntegration(unittest.TestCase):
         for pkg in packages:
             self.assertGreaterEqual(pkg.total_cost, 0)
 
+    def test_scenario_sweep_matches_individual_runs(self):
+        """Test a scenario sweep against pricing each scenario separately"""
+        lines = [
+            "100 5",
+            "PKG1 50 30 OFR001",
+            "PKG2 75 125 OFFR0008",
+            "PKG3 175 100 OFR003",
+            "PKG4 110 60 OFR002",
+            "PKG5 155 95 NA"
+        ]
+        base_cost, packages, _ = InputParser.read_input(lines)
+        offer_service = OfferService()
+        calculator = CostCalculator(base_cost, offer_service)
+        scenarios = [PricingScenario('base_100', 100), PricingScenario('base_150', 150)]
+        results = calculator.calculate_scenarios(packages, scenarios, include_details=True)
+
+        for scenario, result in zip(scenarios, results):
+            single = CostCalculator(scenario.base_delivery_cost, offer_service)
+            single.calculate_costs_batch(packages)
+            expected = [(pkg.pkg_id, pkg.discount, pkg.total_cost) for pkg in packages]
+            self.assertEqual(result.package_costs, expected)
+            self.assertEqual(result.total_revenue, sum(pkg.total_cost for pkg in packages))
+            self.assertEqual(result.total_discount, sum(pkg.discount for pkg in packages))
+
     def test_empty_package_list(self):
         """Test handling of empty package list"""
         vehicles = [Vehicle(1, 70, 200)]
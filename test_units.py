@@ -1,12 +1,17 @@
 """
 Unit tests for courier service components
 """
+import os
+import tempfile
 import unittest
-from models import Offer, Package, Vehicle
+from unittest import mock
+from models import Offer, Package, PricingScenario, Vehicle
 from offer_service import OfferService
 from cost_calculator import CostCalculator
 from delivery_scheduler import DeliveryScheduler
 from input_parser import InputParser
+from online_dispatcher import OnlineDispatcher
+from scheduler_checkpoint import SchedulerCheckpoint
 
 
 class TestModels(unittest.TestCase):
@@ -95,6 +100,53 @@ class TestCostCalculator(unittest.TestCase):
         self.calculator.calculate_cost(pkg)
         self.assertEqual(pkg.discount, 0)
 
+    def test_calculate_scenarios_totals(self):
+        packages = [
+            Package('PKG1', 100, 100, 'OFR001'),
+            Package('PKG2', 10, 50),
+        ]
+        scenarios = [
+            PricingScenario('current', 100),
+            PricingScenario('heavier', 50, weight_multiplier=20, distance_multiplier=0),
+        ]
+        results = self.calculator.calculate_scenarios(packages, scenarios)
+
+        # current: (1600 - 160) + 450
+        self.assertEqual(results[0].total_discount, 160)
+        self.assertEqual(results[0].total_revenue, 1890)
+        # heavier: 2050 with 10% discount = 205, plus 250
+        self.assertEqual(results[1].total_discount, 205)
+        self.assertEqual(results[1].total_revenue, 2095)
+        self.assertIsNone(results[0].package_costs)
+        # Packages are not modified by a sweep
+        self.assertEqual(packages[0].total_cost, 0)
+
+    def test_calculate_scenarios_with_offer_set_and_details(self):
+        offers = OfferService()
+        offers.remove_offer('OFR001')
+        packages = [Package('PKG1', 100, 100, 'OFR001')]
+        scenarios = [PricingScenario('no_ofr001', 100, offer_service=offers)]
+        results = self.calculator.calculate_scenarios(
+            packages, scenarios, include_details=True
+        )
+
+        self.assertEqual(results[0].total_discount, 0)
+        self.assertEqual(results[0].package_costs, [('PKG1', 0, 1600)])
+
+    def test_calculate_scenarios_shares_offer_lookups(self):
+        packages = [Package('PKG1', 100, 100, 'OFR001')]
+        scenarios = [PricingScenario(f'base_{cost}', cost) for cost in (50, 100, 150)]
+        with mock.patch.object(self.offer_service, 'get_offer',
+                               wraps=self.offer_service.get_offer) as get_offer:
+            results = self.calculator.calculate_scenarios(packages, scenarios)
+
+        self.assertEqual(get_offer.call_count, 1)
+        self.assertEqual([result.total_discount for result in results], [155, 160, 165])
+
+    def test_calculate_scenarios_requires_scenario(self):
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_scenarios([Package('PKG1', 10, 50)], [])
+
 
 class TestDeliveryScheduler(unittest.TestCase):
     """Test delivery scheduler"""
@@ -133,12 +185,171 @@ class TestDeliveryScheduler(unittest.TestCase):
             Package('PKG2', 50, 20),
             Package('PKG3', 40, 5),
         ]
-        shipment, remaining = scheduler._select_shipment(packages, 100)
+        shipment, remaining = scheduler.select_shipment(packages, 100)
 
         total_weight = sum(pkg.weight for pkg in shipment)
         self.assertLessEqual(total_weight, 100)
         self.assertGreater(len(remaining), 0)
 
+    def _make_packages(self):
+        return [Package(f'PKG{i}', 20 + (i * 37) % 150, 10 + (i * 53) % 120)
+                for i in range(1, 21)]
+
+    def _make_packages_with_duplicate_id(self):
+        packages = self._make_packages()
+        packages.insert(7, Package('PKG3', 45, 25))
+        return packages
+
+    def _assert_resume_matches(self, make_packages):
+        vehicles = [Vehicle(1, 70, 200), Vehicle(2, 70, 200)]
+        expected = make_packages()
+        DeliveryScheduler(vehicles).schedule_deliveries(expected)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'schedule.ckpt')
+            interrupted = DeliveryScheduler(vehicles)
+            select = interrupted.select_shipment
+            calls = []
+
+            def failing_select(packages, max_load):
+                calls.append(max_load)
+                if len(calls) > 4:
+                    raise KeyboardInterrupt
+                return select(packages, max_load)
+
+            with mock.patch.object(interrupted, 'select_shipment', failing_select):
+                with self.assertRaises(KeyboardInterrupt):
+                    interrupted.schedule_deliveries(make_packages(),
+                                                    checkpoint_path=path,
+                                                    checkpoint_interval=2)
+            self.assertIsNotNone(SchedulerCheckpoint.load(path))
+
+            resumed = make_packages()
+            DeliveryScheduler(vehicles).schedule_deliveries(
+                resumed, checkpoint_path=path, resume=True
+            )
+            self.assertFalse(os.path.exists(path))
+
+        self.assertEqual([pkg.delivery_time for pkg in resumed],
+                         [pkg.delivery_time for pkg in expected])
+
+    def test_resume_matches_uninterrupted_run(self):
+        self._assert_resume_matches(self._make_packages)
+
+    def test_resume_with_repeated_package_id(self):
+        self._assert_resume_matches(self._make_packages_with_duplicate_id)
+
+    def test_resume_rejects_mismatched_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'schedule.ckpt')
+            vehicles = [Vehicle(1, 70, 200)]
+            saved = [Package('PKG1', 50, 30), Package('PKG2', 60, 40)]
+            fingerprint = SchedulerCheckpoint.compute_fingerprint(saved, vehicles)
+            SchedulerCheckpoint(fingerprint, [(0.86, 0)], [(0, 0.43)], [1]).save(path)
+
+            # Same package IDs, different weights and distances
+            edited = [Package('PKG1', 80, 90), Package('PKG2', 60, 40)]
+            with self.assertRaises(ValueError):
+                DeliveryScheduler(vehicles).schedule_deliveries(
+                    edited, checkpoint_path=path, resume=True
+                )
+            with self.assertRaises(ValueError):
+                DeliveryScheduler([Vehicle(1, 80, 200)]).schedule_deliveries(
+                    saved, checkpoint_path=path, resume=True
+                )
+
+    def test_load_rejects_malformed_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'schedule.ckpt')
+            for content in ('[1,2]', 'not json',
+                            '{"version":2,"fingerprint":"x","vehicles":[],'
+                            '"delivered":{},"pending":[]}'):
+                with open(path, 'w') as f:
+                    f.write(content)
+                with self.assertRaises(ValueError):
+                    SchedulerCheckpoint.load(path)
+
+    def test_invalid_checkpoint_interval(self):
+        scheduler = DeliveryScheduler([Vehicle(1, 70, 200)])
+        with self.assertRaises(ValueError):
+            scheduler.schedule_deliveries([], checkpoint_interval=0)
+
+
+class TestOnlineDispatcher(unittest.TestCase):
+    """Test online dispatcher"""
+
+    def test_matches_batch_schedule_when_all_known(self):
+        vehicles = [Vehicle(1, 70, 200), Vehicle(2, 70, 200)]
+        expected = [Package('PKG1', 50, 30), Package('PKG2', 75, 125),
+                    Package('PKG3', 175, 100), Package('PKG4', 110, 60)]
+        DeliveryScheduler(vehicles).schedule_deliveries(expected)
+
+        packages = [Package(pkg.pkg_id, pkg.weight, pkg.distance) for pkg in expected]
+        dispatcher = OnlineDispatcher(vehicles, window_size=len(packages))
+        dispatched = list(dispatcher.dispatch((0.0, pkg) for pkg in packages))
+
+        self.assertEqual(len(dispatched), len(packages))
+        self.assertEqual([pkg.delivery_time for pkg in packages],
+                         [pkg.delivery_time for pkg in expected])
+
+    def test_vehicle_waits_for_arrival(self):
+        dispatcher = OnlineDispatcher([Vehicle(1, 70, 200)], window_size=2)
+        events = [(0.0, Package('PKG1', 50, 70)), (5.0, Package('PKG2', 50, 140))]
+        dispatched = list(dispatcher.dispatch(events))
+
+        self.assertEqual([pkg.pkg_id for pkg in dispatched], ['PKG1', 'PKG2'])
+        self.assertEqual(dispatched[0].delivery_time, 1.0)
+        self.assertEqual(dispatched[1].delivery_time, 7.0)
+
+    def test_earlier_vehicle_does_not_ship_before_arrival(self):
+        vehicles = [Vehicle(1, 70, 200), Vehicle(2, 70, 200)]
+        dispatcher = OnlineDispatcher(vehicles, window_size=5)
+        events = [(5.0, Package('PKG1', 150, 70)), (5.0, Package('PKG2', 150, 70)),
+                  (5.5, Package('PKG3', 40, 35))]
+        dispatched = {pkg.pkg_id: pkg for pkg in dispatcher.dispatch(events)}
+
+        # PKG2 is left over by the first vehicle and taken by the second,
+        # which was free from time 0 but must wait for the arrival
+        self.assertEqual(dispatched['PKG1'].delivery_time, 6.0)
+        self.assertEqual(dispatched['PKG2'].delivery_time, 6.0)
+        for arrival_time, package in events:
+            self.assertGreaterEqual(
+                package.delivery_time,
+                round(arrival_time + package.distance / 70, 2)
+            )
+
+    def test_repeated_package_ids(self):
+        dispatcher = OnlineDispatcher([Vehicle(1, 70, 200)], window_size=5)
+
+        # Both fit in one shipment
+        same_trip = [(0.0, Package('A', 50, 30)), (0.0, Package('A', 60, 40))]
+        self.assertEqual(len(list(dispatcher.dispatch(same_trip))), 2)
+
+        # Only one fits per shipment
+        separate_trips = [(0.0, Package('A', 150, 70)), (0.0, Package('A', 150, 35))]
+        dispatched = list(dispatcher.dispatch(separate_trips))
+        self.assertEqual(len(dispatched), 2)
+        for _, package in same_trip + separate_trips:
+            self.assertIsNotNone(package.delivery_time)
+
+    def test_window_limits_shipment(self):
+        dispatcher = OnlineDispatcher([Vehicle(1, 70, 200)], window_size=1)
+        events = [(0.0, Package('PKG1', 50, 70)), (0.0, Package('PKG2', 50, 70))]
+        dispatched = list(dispatcher.dispatch(events))
+
+        # Only one package is held at a time, so each needs its own trip
+        self.assertEqual([pkg.delivery_time for pkg in dispatched], [1.0, 3.0])
+
+    def test_invalid_stream(self):
+        dispatcher = OnlineDispatcher([Vehicle(1, 70, 200)], window_size=2)
+        with self.assertRaises(ValueError):
+            list(dispatcher.dispatch([(1.0, Package('PKG1', 50, 30)),
+                                      (0.5, Package('PKG2', 50, 30))]))
+        with self.assertRaises(ValueError):
+            list(dispatcher.dispatch([(0.0, Package('PKG1', 250, 30))]))
+        with self.assertRaises(ValueError):
+            OnlineDispatcher([Vehicle(1, 70, 200)], window_size=0)
+
 
 class TestInputParser(unittest.TestCase):
     """Test input parser"""
@@ -183,6 +394,20 @@ class TestInputParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             InputParser.parse_vehicle_info("-2 70 200")
 
+    def test_parse_scenario_valid(self):
+        scenario = InputParser.parse_scenario("heavy 120 12 4")
+        self.assertEqual(scenario.name, "heavy")
+        self.assertEqual(scenario.base_delivery_cost, 120)
+        self.assertEqual(scenario.weight_multiplier, 12)
+        self.assertEqual(scenario.distance_multiplier, 4)
+        self.assertIsNone(InputParser.parse_scenario("base 100").weight_multiplier)
+
+    def test_parse_scenario_invalid(self):
+        with self.assertRaises(ValueError):
+            InputParser.parse_scenario("heavy 120 12")
+        with self.assertRaises(ValueError):
+            InputParser.parse_scenario("heavy -120")
+
     def test_read_input_complete(self):
         lines = [
             "100 2",